@@ -2,19 +2,364 @@
 SOLUTION: Decorator implementations for the process monitor.
 """
 
+import atexit
 import getpass
+import heapq
+import os
+import queue
+import sys
+import threading
+from array import array
 from datetime import datetime
 from functools import wraps
+from operator import itemgetter
 from typing import Final
-import getpass
+
 import psutil
 
+try:
+    import numpy as np
+except ImportError:  # optional, only used to sort column layouts faster
+    np = None
+
 DEFAULT_SUPPRESS: Final[tuple] = (
     PermissionError,
     psutil.AccessDenied,
     psutil.NoSuchProcess,
 )
 
+# Process fields whose values are lists rather than scalars
+LIST_FIELDS: Final[frozenset] = frozenset({"cmdline"})
+
+BYTES_PER_MB: Final[int] = 1 << 20
+MB_PER_BYTE: Final[float] = 1.0 / BYTES_PER_MB
+
+# Maximum number of buffers accepted by a single os.writev() call
+IOV_MAX: Final[int] = 1024
+
+# Maximum number of queued snapshots handled per pass of the log writer thread
+LOG_BATCH_MAX: Final[int] = 1024
+
+LOG_HEADER: Final[str] = (
+    "PID      Name                     User                 CPU%     Mem%  "
+    "Phys Mem(MB)  Exe                             Cmdline"
+)
+LOG_RULE: Final[str] = "=" * len(LOG_HEADER)
+LOG_SEPARATOR: Final[str] = "-" * len(LOG_HEADER)
+LOG_LINE_FMT: Final[str] = (
+    "{pid:<8} {name:<24} {username:<20} {cpu_percent:<8.2f} {memory_percent:<5.2f} "
+    "{phys_mem:<13.2f} {exe:<31} {cmdline}"
+)
+
+
+def _log_fields(proc):
+    """
+    Helper function to prepare a process dictionary for LOG_LINE_FMT.
+
+    Args:
+        proc (dict): Dictionary containing process information.
+
+    Returns:
+        dict: Display values with missing entries replaced and memory in MB.
+    """
+    return {
+        "pid": proc["pid"],
+        "name": proc.get("name") or "N/A",
+        "username": proc.get("username") or "N/A",
+        "cpu_percent": proc.get("cpu_percent") or 0.0,
+        "memory_percent": proc.get("memory_percent") or 0.0,
+        "phys_mem": (proc.get("phys_mem") or 0) * MB_PER_BYTE,
+        "exe": proc.get("exe") or "N/A",
+        "cmdline": " ".join(proc.get("cmdline") or ()) or "N/A",
+    }
+
+
+def _write_lines(filename, lines):
+    """
+    Helper function to write encoded lines to a file with vectored writes.
+
+    On platforms without os.writev (e.g. Windows) the lines are joined and
+    written with a regular file write instead.
+
+    Args:
+        filename (str): Path of the file to (over)write.
+        lines (list): bytes objects to write, in order.
+    """
+    if not hasattr(os, "writev"):
+        with open(filename, "wb") as f:
+            f.write(b"".join(lines))
+        return
+
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        pending = [memoryview(line) for line in lines if line]
+        first = 0
+        while first < len(pending):
+            written = os.writev(fd, pending[first : first + IOV_MAX])
+
+            # Skip the buffers that were fully written and trim a partial one
+            while written and written >= len(pending[first]):
+                written -= len(pending[first])
+                first += 1
+            if written:
+                pending[first] = pending[first][written:]
+    finally:
+        os.close(fd)
+
+
+# Snapshots waiting to be written by the background log writer
+_LOG_Q: queue.SimpleQueue = queue.SimpleQueue()
+_LOG_THREAD: threading.Thread | None = None
+_LOG_THREAD_LOCK = threading.Lock()
+
+
+def _write_batch(batch):
+    """
+    Helper function to write a batch of queued log snapshots.
+
+    Each snapshot overwrites its file, so only the newest one per filename in
+    the batch is written. Errors are reported and never propagate, so a bad
+    snapshot cannot stop the background writer.
+
+    Args:
+        batch (list): (filename, lines) items; None items are ignored.
+    """
+    latest = {}
+    for item in batch:
+        if item is not None:
+            filename, lines = item
+            latest[filename] = lines
+
+    for filename, lines in latest.items():
+        try:
+            _write_lines(filename, lines)
+        except Exception as e:
+            print(f"[Log Error] Could not write '{filename}': {type(e).__name__}: {e}")
+
+
+def _log_writer():
+    """
+    Body of the background log writer thread.
+
+    Drains _LOG_Q in batches of up to LOG_BATCH_MAX items. A None item stops
+    the thread after its batch has been written.
+    """
+    running = True
+    while running:
+        batch = [_LOG_Q.get()]
+        while not _LOG_Q.empty() and len(batch) < LOG_BATCH_MAX:
+            batch.append(_LOG_Q.get_nowait())
+
+        running = None not in batch
+        _write_batch(batch)
+
+
+def _enqueue_log(filename, lines):
+    """
+    Helper function to queue a snapshot for the background log writer.
+
+    Starting the writer and queueing happen under _LOG_THREAD_LOCK, so
+    flush_logs() cannot stop the writer in between and strand the snapshot.
+
+    Args:
+        filename (str): Path of the file to (over)write.
+        lines (list): bytes objects to write, in order.
+    """
+    global _LOG_THREAD
+
+    with _LOG_THREAD_LOCK:
+        # the writer is started lazily, and again after flush_logs()
+        if _LOG_THREAD is None or not _LOG_THREAD.is_alive():
+            _LOG_THREAD = threading.Thread(
+                target=_log_writer, name="log_processes", daemon=True
+            )
+            _LOG_THREAD.start()
+        _LOG_Q.put((filename, lines))
+
+
+def flush_logs():
+    """
+    Wait until every queued background log snapshot has been written.
+
+    The writer thread is stopped and will be restarted by the next
+    background log_processes call. Anything still queued afterwards is
+    written directly. Also run automatically at exit.
+    """
+    global _LOG_THREAD
+
+    with _LOG_THREAD_LOCK:
+        if _LOG_THREAD is not None and _LOG_THREAD.is_alive():
+            _LOG_Q.put(None)
+            _LOG_THREAD.join()
+        _LOG_THREAD = None
+
+        leftover = []
+        while not _LOG_Q.empty():
+            leftover.append(_LOG_Q.get_nowait())
+        _write_batch(leftover)
+
+
+atexit.register(flush_logs)
+
+
+def _process_count(processes):
+    """
+    Helper function to count processes in either process list layout.
+
+    Args:
+        processes: List of process dictionaries, or a dict of columns.
+
+    Returns:
+        int: Number of processes.
+    """
+    if isinstance(processes, dict):
+        return len(next(iter(processes.values()), ()))
+    return len(processes)
+
+
+def _take_columns(columns, indices):
+    """
+    Helper function to reorder or select rows of a dict of columns.
+
+    Args:
+        columns (dict): Column name mapped to a list or array of values.
+        indices: Row indices to keep, in their new order.
+
+    Returns:
+        dict: New columns holding only the given rows, same column types.
+    """
+    taken = {}
+    for name, column in columns.items():
+        values = [column[i] for i in indices]
+        taken[name] = (
+            array(column.typecode, values) if type(column) is array else values
+        )
+    return taken
+
+
+def _rows(processes):
+    """
+    Helper function to iterate over processes in either layout as dicts.
+
+    Args:
+        processes: List of process dictionaries, or a dict of columns.
+
+    Returns:
+        iterable: One dictionary per process.
+    """
+    if isinstance(processes, dict):
+        names = list(processes)
+        return (dict(zip(names, values)) for values in zip(*processes.values()))
+    return processes
+
+
+def _item_getter(field):
+    """
+    Build a sort key function that tolerates missing and list-valued fields.
+
+    Args:
+        field (str): The process field to retrieve.
+
+    Returns:
+        function: Key function mapping a process dictionary to a sortable value.
+    """
+
+    def item_getter(proc):
+        """
+        Helper function to retrieve the sort key from a process dictionary.
+
+        Args:
+            proc (dict): Dictionary containing process information.
+
+        Returns:
+            Any: The value to be used for sorting (e.g., int, float, str).
+        """
+        # field is defined in the enclosing factory as a parameter
+        sort_field = proc.get(field, 0)
+
+        # Deal with process data like cmdlist that is a list
+        # simply treat as a string and concatenate together all elements
+        if type(sort_field) is list:
+            sort_field = " ".join(sort_field)
+
+        return sort_field
+
+    return item_getter
+
+
+def _sort_keys(field):
+    """
+    Helper function to build the sort key functions for a field.
+
+    Args:
+        field (str): The process field to sort by.
+
+    Returns:
+        tuple: (fast key, fallback key). The fast key is a C-implemented
+            itemgetter except for list fields; the fallback tolerates
+            processes missing the field.
+    """
+    item_getter = _item_getter(field)
+    # Only list fields need the Python-level helper, everything else can use
+    # the C-implemented itemgetter
+    sort_key = item_getter if field in LIST_FIELDS else itemgetter(field)
+    return sort_key, item_getter
+
+
+def _sort(processes, field, reverse, sort_key, item_getter):
+    """
+    Helper function to sort processes in either layout by a field.
+
+    Args:
+        processes: List of process dictionaries, or a dict of columns.
+        field (str): The field to sort by.
+        reverse (bool): Sort in descending order.
+        sort_key: Fast key function from _sort_keys.
+        item_getter: Fallback key function from _sort_keys.
+
+    Returns:
+        The sorted processes. Lists are sorted in place, columns are copied.
+
+    Raises:
+        KeyError: If a column layout has no such field.
+        TypeError: If the field values cannot be compared.
+    """
+    if not isinstance(processes, dict):
+        try:
+            processes.sort(key=sort_key, reverse=reverse)
+        except KeyError:
+            # Some processes lack the field, sort those as 0
+            processes.sort(key=item_getter, reverse=reverse)
+        return processes
+
+    # Column layout: sort row indices, then reorder once
+    column = processes[field]
+    if np is not None and type(column) is array:
+        # Packed numeric column: let numpy sort it in C.
+        # Negating keeps ties in their original order, like
+        # sorted(..., reverse=True) does
+        values = np.frombuffer(column, dtype=column.typecode)
+        order = np.argsort(-values if reverse else values, kind="stable").tolist()
+    else:
+        order = sorted(range(len(column)), key=column.__getitem__, reverse=reverse)
+    return _take_columns(processes, order)
+
+
+def _limit(processes, max_count):
+    """
+    Helper function to keep the first max_count processes in either layout.
+
+    Args:
+        processes: List of process dictionaries, or a dict of columns.
+        max_count (int): Maximum number of processes to keep.
+
+    Returns:
+        The first max_count processes, in the same layout.
+    """
+    if isinstance(processes, dict):
+        return {name: column[:max_count] for name, column in processes.items()}
+    return processes[:max_count]
+
 
 def suppress_errors(*exception_types):
     """
@@ -66,34 +411,117 @@ def suppress_errors(*exception_types):
     return suppress_errors_decorator
 
 
-def log_processes(filename="processes_snapshot.log"):
+def log_processes(filename="processes_snapshot.log", background=False):
+    """
+    Decorator factory that writes the returned process list to a log file.
+
+    The whole snapshot is formatted in memory and handed to the kernel with
+    os.writev(), one buffer per line, rather than one write per field.
+
+    Args:
+        filename (str, optional): Path of the log file to (over)write.
+            Defaults to "processes_snapshot.log".
+        background (bool, optional): Queue the snapshot for a background
+            writer thread instead of writing it before returning. Use
+            flush_logs() to wait for queued snapshots. Defaults to False.
+
+    Returns:
+        function: Decorated function that logs its process list.
+    """
+
+    def log_processes_decorator(func):
+        """
+        Inner decorator function.
+
+        Args:
+            func: The function to be decorated.
+
+        Returns:
+            function: Wrapped function with logging capability.
+        """
 
-    #step 1: create function 
-    def decorator(func):
-    #step 2: create wrapper
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            with open(filename, 'w') as f:
-                processes = f.read()
+        def log_processes_wrapper(*args, **kwargs):
+            """
+            Wrapper function that logs the processes to filename.
+
+            Args:
+                *args: Variable length argument list for wrapped function.
+                **kwargs: Arbitrary keyword arguments for wrapped function.
+
+            Returns:
+                list: Process list from the wrapped function, unchanged.
+            """
+            processes = func(*args, **kwargs)
+
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            number_of_processes = f"{timestamp} - {len(processes)} processes"
-            print(number_of_processes) # example output => 2026-01-20 10:30:45 - 15 processes
-            print("=====================================================================================")
-            print("PID      Name                     User                 CPU%     Mem%  Phys Mem(MB)  Exe                             Cmdline")
-            print("-------------------------------------------------------------------------------------")
-            for proc in processes:
-                print(f"{proc['pid']}      {proc['name']}     {proc['username']} {proc['cpu_percent']}    {proc['memory_percent']}    {proc['phys_mem']/1024**2}    {proc['exe']}   {proc['cmdline'].join()}  " )
-            return 
-        return wrapper
-    return decorator
+            header = (
+                f"{timestamp} - {_process_count(processes)} processes\n"
+                f"{LOG_RULE}\n"
+                f"{LOG_HEADER}\n"
+                f"{LOG_SEPARATOR}\n"
+            )
+            lines = [header.encode()]
+            lines += [
+                (LOG_LINE_FMT.format_map(_log_fields(proc)) + "\n").encode()
+                for proc in _rows(processes)
+            ]
+
+            if background:
+                _enqueue_log(filename, lines)
+            else:
+                _write_lines(filename, lines)
+
+            return processes
+
+        return log_processes_wrapper
+
+    return log_processes_decorator
+
 
 def filter_by_current_user(func):
-    @wraps
-    def wrapper(*args, **kwargs):
-        current_user = 
+    """
+    Decorator that keeps only the processes owned by the current user.
+
+    The current user is looked up and interned once, when the function is
+    decorated, so usernames interned by get_processes_info match it by
+    identity before any character comparison.
+
+    Args:
+        func: The function to be decorated.
+
+    Returns:
+        function: Wrapped function returning only the current user's processes.
+    """
+    current_user = sys.intern(getpass.getuser())
+
+    @wraps(func)
+    def filter_by_current_user_wrapper(*args, **kwargs):
+        """
+        Wrapper function that filters processes by username.
+
+        Args:
+            *args: Variable length argument list for wrapped function.
+            **kwargs: Arbitrary keyword arguments for wrapped function.
+
+        Returns:
+            list: Processes whose username matches the current user (a dict
+                of columns if the wrapped function returns one).
+        """
+        processes = func(*args, **kwargs)
+
+        if isinstance(processes, dict):
+            # Column layout: keep the rows whose username matches
+            keep = [
+                row
+                for row, username in enumerate(processes.get("username", ()))
+                if username == current_user
+            ]
+            return _take_columns(processes, keep)
 
+        return [proc for proc in processes if proc.get("username") == current_user]
 
-    pass
+    return filter_by_current_user_wrapper
 
 
 def sort_processes(field="cpu_percent", reverse=True):
@@ -105,10 +533,22 @@ def sort_processes(field="cpu_percent", reverse=True):
             Common fields: 'cpu_percent', 'memory_percent', 'pid', 'name'
         reverse (bool, optional): Sort in descending order. Defaults to True.
 
+    The wrapped function may return a list of process dictionaries or a dict
+    of columns (see get_processes_info(as_columns=True)). Numeric columns are
+    sorted with numpy.argsort when numpy is installed.
+
+    Deprecated for top-N listings: stacking sort_processes and max_listing
+    either sorts every process only to discard most of them, or (with
+    @sort_processes above @max_listing) limits before sorting. Use top_by
+    or pipeline instead.
+
     Returns:
         function: Decorated function that sorts process list by specified field.
     """
 
+    # Define sort key functions
+    sort_key, item_getter = _sort_keys(field)
+
     def sort_processes_decorator(func):
         """
         Inner decorator function.
@@ -135,36 +575,14 @@ def sort_processes(field="cpu_percent", reverse=True):
             # Get the process list
             processes = func(*args, **kwargs)
 
-            # Define sort key function
-            def item_getter(proc):
-                """
-                Helper function to retrieve the sort key from a process dictionary.
-
-                Args:
-                    proc (dict): Dictionary containing process information.
-
-                Returns:
-                    Any: The value to be used for sorting (e.g., int, float, str).
-                """
-                # field is defined in the enclosing sort_process decorator
-                # factory as a parameter
-                sort_field = proc.get(field, 0)
-
-                # Deal with process data like cmdlist that is a list
-                # simply treat as a string and concatenate together all elements
-                if type(sort_field) is list:
-                    sort_field = " ".join(sort_field)
-
-                return sort_field
-
             # Sort by specified field
             try:
-                processes.sort(key=item_getter, reverse=reverse)
+                processes = _sort(processes, field, reverse, sort_key, item_getter)
                 print(
-                    f"[Sorting] Sorted {len(processes)} processes by '{field}' "
+                    f"[Sorting] Sorted {_process_count(processes)} processes by '{field}' "
                     f"({'descending' if reverse else 'ascending'})"
                 )
-            except TypeError as e:
+            except (KeyError, TypeError) as e:
                 print(f"[Sorting Error] Could not sort by '{field}': {e}")
 
             return processes
@@ -182,6 +600,12 @@ def max_listing(max_count=10):
         max_count (int, optional): Maximum number of processes to return.
             Defaults to 10.
 
+    The wrapped function may return a list of process dictionaries or a dict
+    of columns (see get_processes_info(as_columns=True)).
+
+    Deprecated for top-N listings: combine it with sort_processes only to
+    trim an already ordered list. Use top_by or pipeline instead.
+
     Returns:
         function: Decorated function that limits process list to max_count.
     """
@@ -213,16 +637,16 @@ def max_listing(max_count=10):
             processes = func(*args, **kwargs)
 
             # Get the original count
-            original_count = len(processes)
+            original_count = _process_count(processes)
 
             # Limit to max_count
-            limited_processes = processes[:max_count]
+            limited_processes = _limit(processes, max_count)
 
             # Print information about limiting
             if original_count > max_count:
                 print(
                     f"[Max Listing] Limited from {original_count} to "
-                    f"{len(limited_processes)} processes"
+                    f"{_process_count(limited_processes)} processes"
                 )
             else:
                 print(
@@ -234,4 +658,151 @@ def max_listing(max_count=10):
 
         return max_listing_wrapper
 
-    return max_listing_decorator
\ No newline at end of file
+    return max_listing_decorator
+
+
+def top_by(field="cpu_percent", count=10, reverse=True):
+    """
+    Decorator factory that returns only the top processes by a specified field.
+
+    Selects the count processes with a heap instead of sorting the whole
+    list and then slicing it. Use it instead of stacking sort_processes and
+    max_listing, which is deprecated for top-N listings.
+
+    Args:
+        field (str, optional): The field to rank by. Defaults to "cpu_percent".
+        count (int, optional): Maximum number of processes to return.
+            Defaults to 10.
+        reverse (bool, optional): Return the largest values first.
+            Defaults to True.
+
+    Returns:
+        function: Decorated function that returns the top count processes.
+    """
+    select = heapq.nlargest if reverse else heapq.nsmallest
+
+    sort_key, item_getter = _sort_keys(field)
+
+    def top_by_decorator(func):
+        """
+        Inner decorator function.
+
+        Args:
+            func: The function to be decorated.
+
+        Returns:
+            function: Wrapped function with top-N selection capability.
+        """
+
+        @wraps(func)
+        def top_by_wrapper(*args, **kwargs):
+            """
+            Wrapper function that selects the top processes by field.
+
+            Args:
+                *args: Variable length argument list for wrapped function.
+                **kwargs: Arbitrary keyword arguments for wrapped function.
+
+            Returns:
+                list: At most count processes, ordered by field (a dict of
+                    columns if the wrapped function returns one).
+            """
+            # Get the process list
+            processes = func(*args, **kwargs)
+
+            try:
+                if isinstance(processes, dict):
+                    # Column layout: select the top row indices, then take
+                    # those rows from every column
+                    column = processes[field]
+                    rows = select(count, range(len(column)), key=column.__getitem__)
+                    top = _take_columns(processes, rows)
+                else:
+                    try:
+                        top = select(count, processes, key=sort_key)
+                    except KeyError:
+                        # Some processes lack the field, rank those as 0
+                        top = select(count, processes, key=item_getter)
+                print(
+                    f"[Top] Selected {_process_count(top)} of "
+                    f"{_process_count(processes)} processes by '{field}' "
+                    f"({'descending' if reverse else 'ascending'})"
+                )
+            except (KeyError, TypeError) as e:
+                print(f"[Top Error] Could not rank by '{field}': {e}")
+                top = _limit(processes, count)
+
+            return top
+
+        return top_by_wrapper
+
+    return top_by_decorator
+
+
+def pipeline(
+    func,
+    *,
+    suppress=DEFAULT_SUPPRESS,
+    sort_field=None,
+    sort_reverse=True,
+    max_count=None,
+):
+    """
+    Wrap a process function with error suppression, sorting and limiting
+    fused into a single wrapper.
+
+    Runs in one frame and only prints on errors, which suits callers polling
+    many times a second. Sorting always happens before limiting, so the
+    result is the top max_count processes. Stacking the decorators does the
+    opposite: @sort_processes above @max_listing limits first and sorts the
+    remaining processes afterwards.
+
+    Args:
+        func: The function to be wrapped.
+        suppress (tuple, optional): Exception classes to suppress.
+            Defaults to DEFAULT_SUPPRESS.
+        sort_field (str, optional): The field to sort by. Defaults to None
+            (no sorting).
+        sort_reverse (bool, optional): Sort in descending order.
+            Defaults to True.
+        max_count (int, optional): Maximum number of processes to return.
+            Defaults to None (no limit).
+
+    Returns:
+        function: Wrapped function.
+    """
+    if sort_field is not None:
+        sort_key, item_getter = _sort_keys(sort_field)
+
+    @wraps(func)
+    def pipeline_wrapper(*args, **kwargs):
+        """
+        Wrapper function that runs the fused pipeline.
+
+        Args:
+            *args: Variable length argument list for wrapped function.
+            **kwargs: Arbitrary keyword arguments for wrapped function.
+
+        Returns:
+            list: Sorted and limited process list, or empty list if error occurs.
+        """
+        try:
+            processes = func(*args, **kwargs)
+        except suppress as e:
+            print(f"[Suppressed Error] {type(e).__name__}: {e}")
+            return []  # Return empty list for process functions
+
+        if sort_field is not None:
+            try:
+                processes = _sort(
+                    processes, sort_field, sort_reverse, sort_key, item_getter
+                )
+            except (KeyError, TypeError) as e:
+                print(f"[Sorting Error] Could not sort by '{sort_field}': {e}")
+
+        if max_count is not None:
+            processes = _limit(processes, max_count)
+
+        return processes
+
+    return pipeline_wrapper
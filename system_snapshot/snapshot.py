@@ -2,11 +2,16 @@
 System process snapshot tool using psutil.
 """
 
+import os
+import sys
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from typing import Final
 
 import psutil
 from decorators import (
+    MB_PER_BYTE,
     filter_by_current_user,
     log_processes,
     sort_processes,
@@ -15,62 +20,229 @@ from decorators import (
 
 LOG_FILE: Final[str] = "process_snapshot.log"
 
+# Attributes read while CPU% is sampling, see _prime_one
+STATIC_ATTRS: Final[list] = [
+    "pid",
+    "name",
+    "exe",
+    "cmdline",
+    "username",
+]
+
+# Static attributes that only change on exec(), reused from _PROC_CACHE
+CACHED_ATTRS: Final[list] = ["exe"]
+
+# Static attributes read on every scan: setproctitle() rewrites cmdline
+# without changing the name (username is read separately, see _username)
+UNCACHED_ATTRS: Final[list] = ["pid", "name", "cmdline"]
+
+# Attributes that change over time, read once the sampling window has elapsed
+DYNAMIC_ATTRS: Final[list] = [
+    "status",
+    "memory_info",
+    "memory_percent",
+    "cpu_percent",
+]
+
+# Fields returned by get_processes_info(as_columns=True), in column order
+COLUMN_FIELDS: Final[list] = STATIC_ATTRS + DYNAMIC_ATTRS + ["phys_mem"]
+
+# array typecodes for the numeric columns, the rest are plain lists
+COLUMN_TYPECODES: Final[dict] = {
+    "pid": "i",
+    "cpu_percent": "d",
+    "memory_percent": "d",
+    "phys_mem": "q",
+}
+
+# Per-process block of the print_process_info report
+PROC_FMT: Final[str] = (
+    "\n[Process {index}]\n"
+    "  Name:              {name}\n"
+    "  PID:               {pid}\n"
+    "  Executable:        {exe}\n"
+    "  Command Line:      {cmdline}\n"
+    "  Username:         {username}\n"
+    "  CPU:             {cpu_percent:6.2f}% per core\n"
+    "  Memory:          {memory_percent:6.2f}%\n"
+    "  Physical Memory: {phys_mem_mb:6.2f} MB"
+)
+
+# Seconds between the two cpu_percent() readings
+SAMPLE_INTERVAL: Final[float] = 2.0
+
+# CACHED_ATTRS of processes seen by previous scans, keyed by
+# (pid, create_time, name): create_time so a reused pid is never mistaken for
+# the old process, name because exec() replaces name and exe while keeping
+# the pid and create time
+_PROC_CACHE: dict[tuple[int, float, str], dict] = {}
+
+# Interned username for each uid seen, so processes of the same user share
+# one string and username comparisons hit the identity fast path
+_USERNAMES: dict[int, str] = {}
+
+# /proc reads block in the kernel and release the GIL, so threads overlap them
+MAX_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _username(process):
+    """
+    Get the username of a process, interned and looked up once per uid.
+
+    Args:
+        process: psutil.Process, inside its oneshot() context
+
+    Returns:
+        str: Username, or None if access is denied
+    """
+    try:
+        if not psutil.POSIX:
+            return sys.intern(process.username())
+
+        uid = process.uids().real
+        username = _USERNAMES.get(uid)
+        if username is None:
+            username = _USERNAMES[uid] = sys.intern(process.username())
+        return username
+    except psutil.AccessDenied:
+        return None
+
+
+def _prime_one(pid):
+    """
+    Prime CPU% for a single process and collect its static attributes.
+
+    CACHED_ATTRS are served from _PROC_CACHE when the same process (pid,
+    create time and name) was seen by an earlier scan. The rest are read
+    from the /proc files oneshot() loads anyway, since setuid() and
+    setproctitle() change username and cmdline during a process's life.
+
+    Args:
+        pid: Process id, as listed by psutil.pids()
+
+    Returns:
+        tuple: (primed psutil.Process, cache key, static process attributes),
+            or None if the process has exited. The key is None when the
+            process cannot be identified, and the result is then not cached
+    """
+    try:
+        process = psutil.Process(pid)
+        with process.oneshot():
+            process.cpu_percent()
+            static_info = process.as_dict(attrs=UNCACHED_ATTRS, ad_value=None)
+            static_info["username"] = _username(process)
+
+            # inside oneshot() these come from the /proc/pid/stat read
+            # cpu_percent() already did
+            try:
+                key = (pid, process.create_time(), process.name())
+            except psutil.AccessDenied:
+                key = None
+            cached = _PROC_CACHE.get(key)
+            if cached is None:
+                cached = process.as_dict(attrs=CACHED_ATTRS, ad_value=None)
+
+            # freshly read values win over anything cached
+            return process, key, cached | static_info
+    except psutil.NoSuchProcess:
+        return None
+
+
+def _collect_one(process):
+    """
+    Collect the dynamic attributes of a single process.
+
+    Args:
+        process: psutil.Process primed with an initial cpu_percent() call
+
+    Returns:
+        dict: Dynamic process attributes, or None if the process has exited
+    """
+    try:
+        with process.oneshot():
+            return process.as_dict(attrs=DYNAMIC_ATTRS, ad_value=None)
+    except psutil.NoSuchProcess:
+        return None
+
 
 @suppress_errors(
     psutil.ZombieProcess, PermissionError, psutil.AccessDenied, psutil.NoSuchProcess
 )
-def get_processes_info():
+def get_processes_info(as_columns=False):
     """
     Get processes info
 
     Args:
-        cpu_threshold: CPU percentage threshold per core
-        memory_threshold: Memory percentage threshold
+        as_columns: Return one column per field instead of one dictionary
+            per process. Numeric fields are packed into arrays.
 
     Returns:
-        list: List of process dictionaries
+        list: List of process dictionaries, or a dict of columns when
+            as_columns is set. suppress_errors returns an empty list on a
+            suppressed error in either mode; the decorators treat it as an
+            empty snapshot, but check for it before indexing columns.
     """
     proccesses = []
+    columns = {
+        field: array(COLUMN_TYPECODES[field]) if field in COLUMN_TYPECODES else []
+        for field in COLUMN_FIELDS
+    }
 
     # get actual core count - ignore logical cores
-    cpu_count = psutil.cpu_count(logical=False)
+    # (None when it cannot be determined, e.g. in some containers)
+    cpu_count = psutil.cpu_count(logical=False) or 1
+    inv_cpu = 1.0 / cpu_count
 
-    # loop over all processes once to prime cpu utilization
-    for process in psutil.process_iter():
+    # the sampling window starts with the first cpu_percent() reading
+    start = time.monotonic()
 
-        # Get process cpu_percent only reading necessary at this time
-        process_info = process.cpu_percent()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # loop over all processes once to prime cpu utilization,
+        # collecting the static attributes while we are at it.
+        # Keep the Process objects since cpu_percent is measured against them
+        primed = [
+            result
+            for result in executor.map(_prime_one, psutil.pids())
+            if result is not None
+        ]
 
-    # Pause to give system time to gather readings on CPU%
-    time.sleep(2)
+        # Pause for whatever is left of the window to gather readings on CPU%
+        time.sleep(max(0.0, SAMPLE_INTERVAL - (time.monotonic() - start)))
 
-    for process in psutil.process_iter():
-        # Get process info using as_dict
         # Get CPU percent - have to perform twice to get usage between checks
-        process_info = process.as_dict(
-            attrs=[
-                "pid",
-                "name",
-                "exe",
-                "cmdline",
-                "status",
-                "username",
-                "memory_info",
-                "memory_percent",
-                "cpu_percent",
-            ]
+        dynamic = list(
+            executor.map(_collect_one, [process for process, _, _ in primed])
         )
 
+    # rebuild the cache from this scan, dropping processes that have exited
+    _PROC_CACHE.clear()
+
+    for (_, key, static_info), dynamic_info in zip(primed, dynamic):
+        # process exited between the two passes
+        if dynamic_info is None:
+            continue
+
+        if key is not None:
+            _PROC_CACHE[key] = {attr: static_info[attr] for attr in CACHED_ATTRS}
+
+        process_info = static_info | dynamic_info
+
         # Convert CPU % to be for whole system not just one core
-        process_info["cpu_percent"] = process_info["cpu_percent"] / cpu_count
+        process_info["cpu_percent"] = (process_info["cpu_percent"] or 0.0) * inv_cpu
 
         # get physcal memory usage and add it as an element
         # to process info so it can be accessed directly
-        process_info["phys_mem"] = process_info["memory_info"].rss
+        memory_info = process_info["memory_info"]
+        process_info["phys_mem"] = memory_info.rss if memory_info else 0
+        process_info["memory_percent"] = process_info["memory_percent"] or 0.0
 
-        proccesses.append(process_info)
+        if as_columns:
+            for field, column in columns.items():
+                column.append(process_info[field])
+        else:
+            proccesses.append(process_info)
 
-    return proccesses
+    return columns if as_columns else proccesses
 
 
 def print_process_info(processes):
@@ -80,31 +252,37 @@ def print_process_info(processes):
     Args:
         processes: List of process dictionaries
     """
-    BYTES_PER_MB = 1024**24
-
     if not processes:
         print("\nNo processes ")
         return
 
-    print("\n" + "=" * 80)
-    print("PROCESSES")
-    print("=" * 80)
+    # build the whole report and hand it to stdout in a single write
+    out = ["", "=" * 80, "PROCESSES", "=" * 80]
 
     for index, proc in enumerate(processes, 1):
-        print(f"\n[Process {index}]")
-        print(f"  Name:              {proc['name']}")
-        print(f"  PID:               {proc['pid']}")
-        print(f"  Executable:        {proc['exe'] or 'N/A'}")
-
         # Format cmdline (can be very long)
-        cmdline = " ".join(proc["cmdline"]) if proc["cmdline"] else "N/A"
+        cmdline = " ".join(proc["cmdline"] or ())
         if len(cmdline) > 80:
             cmdline = "..." + cmdline[-77:]
-        print(f"  Command Line:      {cmdline}")
-        print(f"  Username:         {proc['username'] or 'N/A'}")
-        print(f"  CPU:             {proc['cpu_percent']:6.2f}% per core")
-        print(f"  Memory:          {proc['memory_percent']:6.2f}%")
-        print(f"  Physical Memory: {proc['phys_mem']/BYTES_PER_MB:6.2f} MB")
+
+        out.append(
+            PROC_FMT.format_map(
+                {
+                    "index": index,
+                    "name": proc["name"],
+                    "pid": proc["pid"],
+                    "exe": proc["exe"] or "N/A",
+                    "cmdline": cmdline or "N/A",
+                    "username": proc["username"] or "N/A",
+                    "cpu_percent": proc["cpu_percent"],
+                    "memory_percent": proc["memory_percent"] or 0.0,
+                    "phys_mem_mb": proc["phys_mem"] * MB_PER_BYTE,
+                }
+            )
+        )
+
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 def main():
@@ -1,11 +1,19 @@
 """Tests for decorator implementations."""
 
+from array import array
+
+import pytest
+
+import decorators
 from decorators import (
     filter_by_current_user,
+    flush_logs,
     log_processes,
     max_listing,
+    pipeline,
     sort_processes,
     suppress_errors,
+    top_by,
 )
 
 
@@ -81,6 +89,102 @@ def test_log_processes(tmp_path):
     assert len(processes) == 2
 
 
+def test_log_processes_background(tmp_path):
+    """Test that log_processes can hand the write to a background thread."""
+    log_file = tmp_path / "test_background.log"
+
+    @log_processes(str(log_file), background=True)
+    def get_test_processes():
+        return [
+            {
+                "pid": 4321,
+                "name": "worker.exe",
+                "cpu_percent": 3.0,
+                "memory_percent": 1.0,
+                "username": "testuser",
+                "cmdline": None,
+                "exe": None,
+                "phys_mem": 0,
+            },
+        ]
+
+    processes = get_test_processes()
+    flush_logs()
+
+    content = log_file.read_text()
+    assert "1 processes" in content
+    assert "worker.exe" in content
+    assert len(processes) == 1
+
+
+def test_flush_logs_writes_queued_snapshots(tmp_path):
+    """Test that flush_logs writes every background snapshot before returning."""
+    first_file = tmp_path / "first.log"
+    second_file = tmp_path / "second.log"
+    snapshots = iter([["a.exe"], ["b.exe", "c.exe"], ["d.exe"]])
+
+    def get_test_processes():
+        return [
+            {"pid": index, "name": name, "username": "testuser"}
+            for index, name in enumerate(next(snapshots))
+        ]
+
+    log_first = log_processes(str(first_file), background=True)(get_test_processes)
+    log_second = log_processes(str(second_file), background=True)(get_test_processes)
+
+    # Nothing queued and no writer running: must not block or fail
+    flush_logs()
+
+    log_first()
+    log_first()
+    log_second()
+    flush_logs()
+
+    # Each snapshot overwrites its file, so only the newest one remains
+    first_content = first_file.read_text()
+    assert "2 processes" in first_content
+    assert "c.exe" in first_content
+    assert "a.exe" not in first_content
+    assert "d.exe" in second_file.read_text()
+
+    # The writer restarts after a flush
+    snapshots = iter([["e.exe"]])
+    log_second()
+    flush_logs()
+
+    assert "e.exe" in second_file.read_text()
+
+
+def test_log_writer_survives_errors(tmp_path, monkeypatch):
+    """Test that an unexpected write error does not stop the writer."""
+    bad_file = tmp_path / "bad.log"
+    good_file = tmp_path / "good.log"
+    write_lines = decorators._write_lines
+
+    def flaky_write_lines(filename, lines):
+        if filename == str(bad_file):
+            raise ValueError("Expected error")
+        write_lines(filename, lines)
+
+    monkeypatch.setattr(decorators, "_write_lines", flaky_write_lines)
+
+    @log_processes(str(bad_file), background=True)
+    def get_bad_processes():
+        return []
+
+    @log_processes(str(good_file), background=True)
+    def get_good_processes():
+        return []
+
+    get_bad_processes()
+    flush_logs()
+    get_good_processes()
+    flush_logs()
+
+    assert not bad_file.exists()
+    assert "0 processes" in good_file.read_text()
+
+
 def test_filter_by_current_user():
     """Test that filter_by_current_user filters processes correctly."""
     import getpass
@@ -143,6 +247,43 @@ def test_sort_processes_by_name():
     assert sorted_procs[2]["name"] == "zebra.exe"
 
 
+def test_sort_processes_missing_field():
+    """Test sort_processes treats a missing sort field as 0."""
+
+    @sort_processes(field="cpu_percent", reverse=True)
+    def get_test_processes():
+        return [
+            {"name": "none.exe"},
+            {"name": "high.exe", "cpu_percent": 20.0},
+            {"name": "low.exe", "cpu_percent": 5.0},
+        ]
+
+    sorted_procs = get_test_processes()
+
+    assert [p["name"] for p in sorted_procs] == ["high.exe", "low.exe", "none.exe"]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "pure-python"])
+def test_sort_processes_columns(use_numpy, monkeypatch):
+    """Test sort_processes reorders every column of a column layout."""
+    if use_numpy and decorators.np is None:
+        pytest.skip("numpy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(decorators, "np", None)
+
+    @sort_processes(field="cpu_percent", reverse=True)
+    def get_test_processes():
+        return {
+            "name": ["low.exe", "high.exe", "medium.exe"],
+            "cpu_percent": array("d", [5.0, 20.0, 10.0]),
+        }
+
+    sorted_procs = get_test_processes()
+
+    assert sorted_procs["name"] == ["high.exe", "medium.exe", "low.exe"]
+    assert sorted_procs["cpu_percent"] == array("d", [20.0, 10.0, 5.0])
+
+
 def test_max_listing_limits_results():
     """Test max_listing decorator limits number of results."""
 
@@ -176,4 +317,129 @@ def test_max_listing_under_limit():
     limited_procs = get_test_processes()
 
     # Should return all processes since under limit
-    assert len(limited_procs) == 2
\ No newline at end of file
+    assert len(limited_procs) == 2
+
+
+def test_max_listing_columns():
+    """Test max_listing slices every column of a column layout."""
+
+    @max_listing(max_count=2)
+    def get_test_processes():
+        return {
+            "name": ["proc1.exe", "proc2.exe", "proc3.exe"],
+            "pid": array("i", [1, 2, 3]),
+        }
+
+    limited_procs = get_test_processes()
+
+    assert limited_procs["name"] == ["proc1.exe", "proc2.exe"]
+    assert limited_procs["pid"] == array("i", [1, 2])
+
+
+def test_top_by():
+    """Test top_by decorator returns the highest values in order."""
+
+    @top_by(field="cpu_percent", count=2)
+    def get_test_processes():
+        return [
+            {"name": "low.exe", "cpu_percent": 5.0},
+            {"name": "high.exe", "cpu_percent": 20.0},
+            {"name": "none.exe"},
+            {"name": "medium.exe", "cpu_percent": 10.0},
+        ]
+
+    top_procs = get_test_processes()
+
+    assert [p["name"] for p in top_procs] == ["high.exe", "medium.exe"]
+
+
+def test_pipeline():
+    """Test pipeline sorts, limits and suppresses errors in one wrapper."""
+
+    def get_test_processes(should_fail=False):
+        if should_fail:
+            raise PermissionError("Expected error")
+        return [
+            {"name": "low.exe", "cpu_percent": 5.0},
+            {"name": "high.exe", "cpu_percent": 20.0},
+            {"name": "medium.exe", "cpu_percent": 10.0},
+        ]
+
+    top_procs = pipeline(get_test_processes, sort_field="cpu_percent", max_count=2)
+
+    assert [p["name"] for p in top_procs()] == ["high.exe", "medium.exe"]
+    assert top_procs(should_fail=True) == []
+
+
+def test_column_layout_decorators(tmp_path):
+    """Test top_by, filter_by_current_user and log_processes on columns."""
+    import getpass
+
+    log_file = tmp_path / "columns.log"
+
+    @top_by(field="cpu_percent", count=2)
+    @filter_by_current_user
+    @log_processes(str(log_file))
+    def get_test_processes():
+        return {
+            "pid": array("i", [1, 2, 3, 4]),
+            "name": ["low.exe", "other.exe", "high.exe", "medium.exe"],
+            "username": [getpass.getuser(), "other_user", getpass.getuser(), None],
+            "cpu_percent": array("d", [5.0, 50.0, 20.0, 10.0]),
+            "memory_percent": array("d", [1.0, 1.0, 1.0, 1.0]),
+            "phys_mem": array("q", [0, 0, 0, 0]),
+            "exe": [None, None, None, None],
+            "cmdline": [None, None, None, None],
+        }
+
+    top_procs = get_test_processes()
+
+    assert top_procs["name"] == ["high.exe", "low.exe"]
+    assert top_procs["cpu_percent"] == array("d", [20.0, 5.0])
+
+    content = log_file.read_text()
+    assert "4 processes" in content
+    assert "other.exe" in content
+
+
+def test_top_by_columns_selects_without_sorting(monkeypatch):
+    """Test top_by picks column rows with a heap rather than a full sort."""
+
+    def fail_sort(*args, **kwargs):
+        raise AssertionError("top_by should not sort every row")
+
+    monkeypatch.setattr(decorators, "_sort", fail_sort)
+
+    @top_by(field="cpu_percent", count=3, reverse=False)
+    def get_test_processes():
+        return {
+            "name": ["a.exe", "b.exe", "c.exe", "d.exe", "e.exe"],
+            "cpu_percent": array("d", [9.0, 1.0, 5.0, 1.0, 7.0]),
+        }
+
+    top_procs = get_test_processes()
+
+    assert top_procs["name"] == ["b.exe", "d.exe", "c.exe"]
+    assert top_procs["cpu_percent"] == array("d", [1.0, 1.0, 5.0])
+
+
+@pytest.mark.skipif(not hasattr(decorators.os, "writev"), reason="needs os.writev")
+def test_write_lines_partial_writes(tmp_path, monkeypatch):
+    """Test _write_lines resumes short writes and batches by IOV_MAX."""
+    target = tmp_path / "partial.log"
+    lines = [f"line {i}\n".encode() for i in range(decorators.IOV_MAX * 2 + 5)]
+    real_writev = decorators.os.writev
+    batch_sizes = []
+
+    def short_writev(fd, buffers):
+        # write at most 7 bytes per call, so most calls stop mid-buffer
+        batch_sizes.append(len(buffers))
+        data = b"".join(buffers)[:7]
+        return real_writev(fd, [data])
+
+    monkeypatch.setattr(decorators.os, "writev", short_writev)
+
+    decorators._write_lines(str(target), lines)
+
+    assert target.read_bytes() == b"".join(lines)
+    assert max(batch_sizes) == decorators.IOV_MAX
@@ -0,0 +1,102 @@
+"""Tests for the process snapshot helpers."""
+
+import os
+
+import psutil
+
+import snapshot
+
+
+def test_prime_one_cache_hit(monkeypatch):
+    """Test that _prime_one reuses the cached exe."""
+    process = psutil.Process(os.getpid())
+    key = (process.pid, process.create_time(), process.name())
+    monkeypatch.setattr(snapshot, "_PROC_CACHE", {key: {"exe": "/cached/exe"}})
+
+    _, result_key, static_info = snapshot._prime_one(process.pid)
+
+    assert result_key == key
+    assert static_info["exe"] == "/cached/exe"
+
+
+def test_prime_one_rereads_cmdline_and_username(monkeypatch):
+    """Test that cmdline and username are never served from the cache."""
+    process = psutil.Process(os.getpid())
+    key = (process.pid, process.create_time(), process.name())
+    stale = {"exe": "/cached/exe", "cmdline": ["old title"], "username": "nobody"}
+    monkeypatch.setattr(snapshot, "_PROC_CACHE", {key: stale})
+
+    _, _, static_info = snapshot._prime_one(process.pid)
+
+    assert static_info["cmdline"] == process.cmdline()
+    assert static_info["username"] == process.username()
+
+
+def test_prime_one_cache_miss_after_exec(monkeypatch):
+    """Test that a changed name (e.g. after exec) bypasses the cache."""
+    process = psutil.Process(os.getpid())
+    stale_key = (process.pid, process.create_time(), "sh")
+    monkeypatch.setattr(snapshot, "_PROC_CACHE", {stale_key: {"exe": "/bin/sh"}})
+
+    _, result_key, static_info = snapshot._prime_one(process.pid)
+
+    assert result_key != stale_key
+    assert static_info["name"] == process.name()
+    assert static_info["exe"] == process.exe()
+
+
+def _report_process(**overrides):
+    """Build a process dictionary for print_process_info tests."""
+    proc = {
+        "name": "test.exe",
+        "pid": 1234,
+        "exe": "/path/to/test.exe",
+        "cmdline": ["test.exe", "--arg"],
+        "username": "testuser",
+        "cpu_percent": 15.5,
+        "memory_percent": 8.2,
+        "phys_mem": 100 * 1024 * 1024,  # 100 MB in bytes
+    }
+    proc.update(overrides)
+    return proc
+
+
+def test_print_process_info(capsys):
+    """Test the report converts memory to MB and formats each process."""
+    snapshot.print_process_info([_report_process()])
+
+    out = capsys.readouterr().out
+    assert "[Process 1]" in out
+    assert "test.exe --arg" in out
+    assert " 15.50% per core" in out
+    assert "100.00 MB" in out
+
+
+def test_print_process_info_cmdline(capsys):
+    """Test missing command lines print N/A and long ones are shortened."""
+    long_cmdline = ["test.exe"] + ["--option"] * 20
+
+    snapshot.print_process_info(
+        [
+            _report_process(cmdline=None),
+            _report_process(cmdline=[]),
+            _report_process(cmdline=long_cmdline),
+        ]
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    cmdlines = [line for line in lines if line.startswith("  Command Line:")]
+    assert cmdlines[0].endswith("N/A")
+    assert cmdlines[1].endswith("N/A")
+
+    shortened = cmdlines[2].split(":", 1)[1].strip()
+    assert shortened.startswith("...")
+    assert len(shortened) == 80
+    assert shortened.endswith(" ".join(long_cmdline)[-77:])
+
+
+def test_print_process_info_empty(capsys):
+    """Test the report for an empty process list."""
+    snapshot.print_process_info([])
+
+    assert "No processes" in capsys.readouterr().out